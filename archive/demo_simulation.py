@@ -20,6 +20,7 @@ NO broker connections. NO portfolio decisions. Pure signal validation.
 Author: Quantitative Portfolio Engineering Team
 """
 
+import sys
 import time
 import logging
 import datetime
@@ -40,29 +41,75 @@ logging.basicConfig(level=logging.ERROR)
 # =============================================================================
 # NOTE: ATR and Volatility Logic removed from here. Imported from volatility_metrics.py
 
+def _coerce_sentiments(news_items: List[Dict[str, Any]]) -> List[float]:
+    """Validates news items once at the boundary. Raises ValueError on bad data."""
+    try:
+        return [float(item.get("sentiment", 0.0)) for item in news_items]
+    except (AttributeError, TypeError, ValueError, OverflowError) as e:
+        raise ValueError(f"Invalid news item: {e}") from e
+
+
+def _coerce_vitals_scores(positions: List[Dict[str, Any]]) -> List[float]:
+    """Validates positions once at the boundary. Raises ValueError on bad data."""
+    try:
+        return [float(p.get("vitals_score", 50.0)) for p in positions]
+    except (AttributeError, TypeError, ValueError, OverflowError) as e:
+        raise ValueError(f"Invalid position: {e}") from e
+
+
+def summarize_sentiments(sentiments: List[float]) -> Dict[str, Any]:
+    """Aggregates pre-validated, non-empty sentiment values."""
+    avg_sentiment = sum(sentiments) / len(sentiments)
+    
+    if avg_sentiment > 0.2:
+        bias = "POSITIVE"
+    elif avg_sentiment < -0.2:
+        bias = "NEGATIVE"
+    else:
+        bias = "NEUTRAL"
+        
+    return {
+        "score": round(avg_sentiment, 3),
+        "bias": bias,
+        "item_count": len(sentiments)
+    }
+
+
+def summarize_vitals_scores(scores: List[float]) -> Dict[str, Any]:
+    """Aggregates pre-validated, non-empty vitals scores."""
+    # Band all scores in a single pass (sum/min/max below are C-level builtins)
+    healthy = weak = unhealthy = 0
+    for s in scores:
+        if s >= 60:
+            healthy += 1
+        elif s >= 40:
+            weak += 1
+        elif s < 40:
+            # elif, not else: NaN scores belong to no band
+            unhealthy += 1
+    
+    return {
+        "count": len(scores),
+        "avg_vitals": round(sum(scores) / len(scores), 2),
+        "min_vitals": round(min(scores), 2),
+        "max_vitals": round(max(scores), 2),
+        "healthy_count": healthy,
+        "weak_count": weak,
+        "unhealthy_count": unhealthy
+    }
+
+
 def compute_news_sentiment(news_items: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Computes aggregate news sentiment score from news items."""
     if not news_items:
         return {"score": 0.0, "bias": "NEUTRAL", "item_count": 0}
     
     try:
-        sentiments = [float(item.get("sentiment", 0.0)) for item in news_items]
-        avg_sentiment = sum(sentiments) / len(sentiments)
-        
-        if avg_sentiment > 0.2:
-            bias = "POSITIVE"
-        elif avg_sentiment < -0.2:
-            bias = "NEGATIVE"
-        else:
-            bias = "NEUTRAL"
-            
-        return {
-            "score": round(avg_sentiment, 3),
-            "bias": bias,
-            "item_count": len(news_items)
-        }
-    except Exception:
+        sentiments = _coerce_sentiments(news_items)
+    except ValueError:
         return {"score": 0.0, "bias": "ERROR", "item_count": 0}
+    
+    return summarize_sentiments(sentiments)
 
 
 def compute_position_vitals_summary(positions: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -75,22 +122,29 @@ def compute_position_vitals_summary(positions: List[Dict[str, Any]]) -> Dict[str
         }
     
     try:
-        scores = [float(p.get("vitals_score", 50.0)) for p in positions]
-        healthy = sum(1 for s in scores if s >= 60)
-        weak = sum(1 for s in scores if 40 <= s < 60)
-        unhealthy = sum(1 for s in scores if s < 40)
-        
-        return {
-            "count": len(positions),
-            "avg_vitals": round(sum(scores) / len(scores), 2),
-            "min_vitals": round(min(scores), 2),
-            "max_vitals": round(max(scores), 2),
-            "healthy_count": healthy,
-            "weak_count": weak,
-            "unhealthy_count": unhealthy
-        }
-    except Exception:
+        scores = _coerce_vitals_scores(positions)
+    except ValueError:
         return {"count": 0, "avg_vitals": 0.0}  # Safe fallback
+    
+    return summarize_vitals_scores(scores)
+
+
+def compute_phase2_signals(candles: List[Dict[str, Any]], news_items: List[Dict[str, Any]],
+                           positions: List[Dict[str, Any]], baseline_atr: float,
+                           threshold_pct: float = 10.0) -> Dict[str, Any]:
+    """Computes every Phase 2 signal for one dataset in a single call."""
+    atr = compute_atr(candles).get("atr")
+    if atr is None:
+        atr = 0.0
+    
+    vol_res = classify_volatility_state(atr, baseline_atr=baseline_atr, threshold_pct=threshold_pct)
+    
+    return {
+        "atr": atr,
+        "volatility_state": vol_res.get("volatility_state", "UNKNOWN"),
+        "news_sentiment": compute_news_sentiment(news_items),
+        "vitals_summary": compute_position_vitals_summary(positions)
+    }
 
 
 # =============================================================================
@@ -99,29 +153,30 @@ def compute_position_vitals_summary(positions: List[Dict[str, Any]]) -> Dict[str
 
 def print_phase2_signals(timestamp: str, atr: float, volatility_state: str, 
                         news_sentiment: Dict[str, Any], vitals_summary: Dict[str, Any] = None):
-    """Prints Phase 2 signals in a clean, human-readable format."""
-    print(f"\n{'='*50}")
-    print(f"  PHASE 2 SIGNALS  [{timestamp}]")
-    print(f"{'='*50}\n")
-    
+    """Prints Phase 2 signals in a clean, human-readable format (one write)."""
     # Handle potentially None ATR
     display_atr = atr if atr is not None else 0.0
     
-    print(f"  ATR (15m):           {display_atr:.4f}")
-    print(f"  Volatility State:    {volatility_state}\n")
-    
-    print(f"  News Sentiment:      {news_sentiment['score']:+.3f} ({news_sentiment['bias']})")
-    print(f"  News Items Analyzed: {news_sentiment['item_count']}\n")
+    lines = [
+        f"\n{'='*50}",
+        f"  PHASE 2 SIGNALS  [{timestamp}]",
+        f"{'='*50}\n",
+        f"  ATR (15m):           {display_atr:.4f}",
+        f"  Volatility State:    {volatility_state}\n",
+        f"  News Sentiment:      {news_sentiment['score']:+.3f} ({news_sentiment['bias']})",
+        f"  News Items Analyzed: {news_sentiment['item_count']}\n",
+    ]
     
     if vitals_summary and vitals_summary.get("count", 0) > 0:
-        print(f"  Position Count:      {vitals_summary['count']}")
-        print(f"  Avg Vitals Score:    {vitals_summary['avg_vitals']}")
-        print(f"  Vitals Range:        [{vitals_summary['min_vitals']} - {vitals_summary['max_vitals']}]")
-        print(f"  Health Distribution: {vitals_summary['healthy_count']} healthy, "
-              f"{vitals_summary['weak_count']} weak, "
-              f"{vitals_summary['unhealthy_count']} unhealthy\n")
+        lines.append(f"  Position Count:      {vitals_summary['count']}")
+        lines.append(f"  Avg Vitals Score:    {vitals_summary['avg_vitals']}")
+        lines.append(f"  Vitals Range:        [{vitals_summary['min_vitals']} - {vitals_summary['max_vitals']}]")
+        lines.append(f"  Health Distribution: {vitals_summary['healthy_count']} healthy, "
+                     f"{vitals_summary['weak_count']} weak, "
+                     f"{vitals_summary['unhealthy_count']} unhealthy\n")
     
-    print(f"{'-'*50}\n")
+    lines.append(f"{'-'*50}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_separator():
@@ -132,6 +187,24 @@ def print_separator():
 # MOCK DATA GENERATORS (Standalone - No Broker Dependencies)
 # =============================================================================
 
+def _fill_candle_prices(n: int, base_price: float, price_range: float, high_vol: bool):
+    """Fills parallel open/high/low/close lists in one numeric pass."""
+    ramp = price_range / 5
+    opens, highs, lows, closes = [], [], [], []
+    for i in range(n):
+        if i < 5:
+            high_mod = (i + 1) * ramp
+        else:
+            high_mod = 2.0 + (i % 3) if high_vol else 0.5
+        
+        base = base_price + i
+        opens.append(base)
+        highs.append(base + high_mod)
+        lows.append(base - (high_mod / 2))
+        closes.append(base + (high_mod / 2))
+    return opens, highs, lows, closes
+
+
 def generate_mock_candles(scenario: str = "normal") -> List[Dict[str, Any]]:
     """Generates mock OHLC candle data for testing."""
     # Ensure canonical function expects 'timestamp' field.
@@ -145,19 +218,17 @@ def generate_mock_candles(scenario: str = "normal") -> List[Dict[str, Any]]:
     else:
         price_range = 1.5
 
-    candles = []
-    for i in range(20): 
-        ts = base_ts + datetime.timedelta(minutes=15*i)
-        high_mod = (i+1) * (price_range / 5) if i < 5 else (0.5 if scenario != "high_vol" else 2.0 + (i%3))
-        
-        candles.append({
-            "timestamp": ts.isoformat(),
-            "open": base_price + i,
-            "high": base_price + i + high_mod,
-            "low": base_price + i - (high_mod/2),
-            "close": base_price + i + (high_mod/2)
-        })
-    return candles
+    n = 20
+    opens, highs, lows, closes = _fill_candle_prices(n, base_price, price_range, scenario == "high_vol")
+    
+    # Format all timestamps in one batch before assembling the candle dicts
+    step = datetime.timedelta(minutes=15)
+    timestamps = [(base_ts + step * i).isoformat() for i in range(n)]
+    
+    return [
+        {"timestamp": ts, "open": o, "high": h, "low": l, "close": c}
+        for ts, o, h, l, c in zip(timestamps, opens, highs, lows, closes)
+    ]
 
 
 def generate_mock_news(scenario: str = "neutral") -> List[Dict[str, Any]]:
@@ -233,20 +304,17 @@ def main():
         dataset = real_candles
         baseline_atr = 1.5 # Fixed baseline for demo purposes
 
-    # Compute ATR
-    atr_result = compute_atr(dataset)
-    atr = atr_result.get("atr")
-    if atr is None:
-        atr = 0.0
-        
-    # Compute Volatility State (Using New Signature)
-    # returns {'volatility_state': '...'}
-    vol_res = classify_volatility_state(atr, baseline_atr=baseline_atr, threshold_pct=10.0)
-    vol_state = vol_res.get("volatility_state", "UNKNOWN")
-    
     # News is always mock since we removed news fetching from Phase 1
-    sentiment = compute_news_sentiment(generate_mock_news("neutral")) 
-    vitals = compute_position_vitals_summary(generate_mock_positions("mixed"))
+    signals = compute_phase2_signals(
+        dataset,
+        generate_mock_news("neutral"),
+        generate_mock_positions("mixed"),
+        baseline_atr=baseline_atr
+    )
+    atr = signals["atr"]
+    vol_state = signals["volatility_state"]
+    sentiment = signals["news_sentiment"]
+    vitals = signals["vitals_summary"]
     
     print_phase2_signals("CURRENT", atr, vol_state, sentiment, vitals)
     
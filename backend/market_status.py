@@ -7,6 +7,9 @@ try:
 except ImportError:
     pass
 
+# Label of the fallback status returned when the clock request fails
+ERROR_LABEL = "CLOSED (Error)"
+
 def get_market_status():
     """
     Fetches market status from Alpaca Clock API.
@@ -51,6 +54,6 @@ def get_market_status():
             "is_open": False,
             "next_open": None,
             "next_close": None,
-            "label": "CLOSED (Error)",
+            "label": ERROR_LABEL,
             "timestamp": datetime.now().isoformat()
         }
@@ -23,6 +23,7 @@ except ImportError:
     pass  # dotenv optional if env vars set externally
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class AlpacaAdapter:
@@ -86,6 +87,12 @@ class AlpacaAdapter:
             "Content-Type": "application/json"
         }
         
+        # Pooled keep-alive session: reuses TCP/TLS connections across calls.
+        # Auth headers stay per-request so they never reach the Polygon host.
+        self._session = requests.Session()
+        pooled = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self._session.mount("https://", pooled)
+        
         self._initialized = True
     
     def _request(self, endpoint: str, base: str = None) -> Dict[str, Any]:
@@ -106,7 +113,7 @@ class AlpacaAdapter:
         url = f"{base_url}{endpoint}"
         
         try:
-            response = requests.get(url, headers=self._headers, timeout=10)
+            response = self._session.get(url, headers=self._headers, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -263,7 +270,7 @@ class AlpacaAdapter:
         params = {"adjusted": "true", "sort": "asc", "limit": limit, "apiKey": api_key}
         
         try:
-            response = requests.get(url, params=params, timeout=5)
+            response = self._session.get(url, params=params, timeout=5)
             if response.status_code != 200:
                 return []
                 
@@ -8,6 +8,34 @@ import news_scorer
 import sector_confidence
 import risk_guardrails
 import random 
+from dataclasses import dataclass, asdict
+from operator import itemgetter
+
+# =============================================================================
+# REPORT CONTAINER
+# =============================================================================
+
+@dataclass(slots=True, frozen=True)
+class DecisionReport:
+    """
+    Output of run_decision_engine.
+    Slotted so long replays can retain thousands of reports cheaply and
+    consumers read fields by attribute instead of dict subscription.
+    """
+    pm_summary: str
+    market_posture: dict
+    superiority_analysis: dict
+    execution_context: dict
+    decisions: list
+    blocked_by_safety: list
+    concentration_risk: dict
+    reallocation_trigger: bool
+    opportunity_scan: dict
+    pressure_score: float
+
+    def as_dict(self) -> dict:
+        """Returns the report as a plain (JSON-safe) dict."""
+        return asdict(self)
 
 # =============================================================================
 # HELPER: PM Summary Generation
@@ -109,7 +137,7 @@ def _structure_superiority_output(safe_decisions: list, blocked_decisions: list,
                 "reason": d["reason"]
             })
             
-    alternatives.sort(key=lambda x: x["score"], reverse=True)
+    alternatives.sort(key=itemgetter("score"), reverse=True)
     top_alternatives = alternatives[:3]
     
     # 3. Decision Confidence (0-1)
@@ -227,7 +255,7 @@ def determine_market_posture(
         "reasons": reasons
     }
 
-def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap: dict, candidates: list, market_context: dict = None, execution_context: dict = None) -> dict:
+def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap: dict, candidates: list, market_context: dict = None, execution_context: dict = None) -> DecisionReport:
     """
     Orchestrates portfolio decisions.
     
@@ -333,6 +361,14 @@ def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap:
     # ---------------------------------------------------------
     decisions = []
     
+    # Concentration checks only matter when a sector has breached or is
+    # approaching the limit. Healthy portfolios skip the per-row sector
+    # comparisons entirely.
+    dominant_sector = conc_warning["dominant_sector"]
+    sector_breached = conc_warning["is_concentrated"]
+    sector_approaching = conc_warning["severity"] == "APPROACHING"
+    concentration_active = sector_breached or sector_approaching
+    
     # A. Process Existing Positions
     for pos in analyzed_positions:
         symbol = pos["symbol"]
@@ -348,7 +384,7 @@ def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap:
         action = "MAINTAIN"
         reason = f"Strong vitals ({vitals}). Efficient."
 
-        is_concentrated_sector = conc_warning["is_concentrated"] and sector == conc_warning["dominant_sector"]
+        is_concentrated_sector = sector_breached and sector == dominant_sector
 
         if symbol in dead_capital_symbols and reallocation_pressure:
             if better_opp_exists and opp_confidence == "HIGH":
@@ -390,6 +426,12 @@ def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap:
         })
 
     # B. Process Candidates
+    # Loop-invariant inputs are resolved once so each candidate costs a single
+    # set lookup plus a handful of boolean tests (screening universes can be large).
+    inflows_blocked = not active_candidates
+    has_liquidity = portfolio_state["cash"] > 100000
+    hot_sector_set = set(hot_sectors)
+
     for cand in candidates:
         symbol = cand["symbol"]
         sector = cand["sector"]
@@ -398,20 +440,18 @@ def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap:
         action = "IGNORE"
         reason = f"Sector {sector} not attractive."
         
-        is_ignored_due_to_posture = cand not in active_candidates
-        
-        if is_ignored_due_to_posture:
+        if inflows_blocked:
             action = "BLOCK_POSTURE"
             reason = f"Market Posture is {posture_report['market_posture']}. inflows blocked."
         else:
-            is_sector_approaching = conc_warning["severity"] == "APPROACHING" and sector == conc_warning["dominant_sector"]
-            is_sector_breached = conc_warning["is_concentrated"] and sector == conc_warning["dominant_sector"]
+            is_dominant = concentration_active and sector == dominant_sector
+            is_sector_approaching = sector_approaching and is_dominant
             
-            if is_sector_breached:
+            if sector_breached and is_dominant:
                 action = "BLOCK_RISK"
                 reason = f"Cannot allocate. Sector {sector} already over-concentrated ({conc_warning['exposure']:.0%})."
             
-            elif sector in hot_sectors:
+            elif sector in hot_sector_set:
                 if reallocation_pressure:
                     if is_sector_approaching:
                         action = "ALLOCATE_CAPPED"
@@ -420,7 +460,7 @@ def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap:
                         action = "ALLOCATE_HIGH"
                         reason = f"Hot sector ({sector}). Deploying freed capital."
                 
-                elif portfolio_state["cash"] > 100000:
+                elif has_liquidity:
                     if is_sector_approaching:
                         action = "ALLOCATE_CAUTIOUS"
                         reason = f"Hot sector, but nearing concentration limit."
@@ -501,18 +541,18 @@ def run_decision_engine(portfolio_state: dict, positions: list, sector_heatmap:
     # B. Superiority Analysis
     superiority_metrics = _structure_superiority_output(safe_decisions, blocked_decisions, candidates, posture_report)
 
-    return {
-        "pm_summary": pm_summary,
-        "market_posture": posture_report,
-        "superiority_analysis": superiority_metrics,
-        "execution_context": execution_context,
-        "decisions": safe_decisions,
-        "blocked_by_safety": blocked_decisions,
-        "concentration_risk": conc_warning,
-        "reallocation_trigger": reallocation_pressure,
-        "opportunity_scan": opportunity_report,
-        "pressure_score": lock_in_report["pressure_score"]
-    }
+    return DecisionReport(
+        pm_summary=pm_summary,
+        market_posture=posture_report,
+        superiority_analysis=superiority_metrics,
+        execution_context=execution_context,
+        decisions=safe_decisions,
+        blocked_by_safety=blocked_decisions,
+        concentration_risk=conc_warning,
+        reallocation_trigger=reallocation_pressure,
+        opportunity_scan=opportunity_report,
+        pressure_score=lock_in_report["pressure_score"]
+    )
 
 # ---------------------------------------------------------
 # Usage Example (Demo)
@@ -539,9 +579,9 @@ def run_demo():
 
     report = run_decision_engine(portfolio_t0, positions_t0, heatmap_t0, candidates_t0, execution_context=context)
     
-    print(f"\n[PM Summary]\n{report['pm_summary']}")
+    print(f"\n[PM Summary]\n{report.pm_summary}")
     
-    analysis = report['superiority_analysis']
+    analysis = report.superiority_analysis
     print(f"\n[Primary Decision]")
     if analysis['primary_decision']:
         p = analysis['primary_decision']
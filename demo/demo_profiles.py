@@ -13,14 +13,38 @@ PROFILES:
 Author: Quantitative Portfolio Engineering Team
 """
 
-from typing import Dict, List, Any, Tuple
+from dataclasses import dataclass, asdict
+from functools import cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+
+
+# =============================================================================
+# POSITION RECORD
+# =============================================================================
+
+@dataclass(slots=True, frozen=True)
+class Position:
+    """Immutable demo position record (slotted: no per-instance dict)."""
+    symbol: str
+    sector: str
+    entry_price: float
+    current_price: float
+    atr: float
+    days_held: int
+    capital_allocated: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the position in the dict schema used by the engine."""
+        return asdict(self)
 
 
 # =============================================================================
 # PROFILE DEFINITIONS
 # =============================================================================
 
-PROFILES = {
+_PROFILE_DEFINITIONS = {
     
     # -------------------------------------------------------------------------
     # PROFILE 1: BALANCED_TECH
@@ -373,13 +397,53 @@ PROFILES = {
 }
 
 
+# =============================================================================
+# PRECOMPUTED AGGREGATES
+# =============================================================================
+# Profiles are static, so sector allocation is aggregated once (on first access
+# to that profile) and each profile is exposed through a read-only top-level
+# view. The view is shallow: portfolio_state, candidates and sector_heatmap
+# are shared with every caller and must be treated as read-only.
+
+def _freeze_profile(definition: Dict[str, Any]) -> MappingProxyType:
+    """Build a profile with sector aggregates attached; the definition is not modified."""
+    profile = dict(definition)
+    
+    positions = tuple(Position(**p) for p in definition["positions"])
+    profile["positions"] = positions
+    
+    sector_alloc = {}
+    for p in positions:
+        sector_alloc[p.sector] = sector_alloc.get(p.sector, 0.0) + p.capital_allocated
+    
+    total = profile["portfolio_state"]["total_capital"]
+    # Ordered largest exposure first so display paths never need to re-sort
+    ranked = sorted(sector_alloc.items(), key=itemgetter(1), reverse=True)
+    profile["_sector_pct"] = {s: (v / total) * 100 for s, v in ranked}
+    return MappingProxyType(profile)
+
+
+@cache
+def _get_profile(profile_name: str) -> Optional[MappingProxyType]:
+    """Frozen profile, built on first access so unused profiles cost nothing."""
+    definition = _PROFILE_DEFINITIONS.get(profile_name)
+    if definition is None:
+        return None
+    return _freeze_profile(definition)
+
+
+# Public name for the raw profile definitions (plain dicts, original schema).
+# _freeze_profile never modifies them.
+PROFILES = _PROFILE_DEFINITIONS
+
+
 # =============================================================================
 # PUBLIC API
 # =============================================================================
 
 def get_available_profiles() -> List[str]:
     """Returns list of available demo profile names."""
-    return list(PROFILES.keys())
+    return list(_PROFILE_DEFINITIONS.keys())
 
 
 def load_demo_profile(profile_name: str = "OVERCONCENTRATED_TECH") -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
@@ -395,33 +459,45 @@ def load_demo_profile(profile_name: str = "OVERCONCENTRATED_TECH") -> Tuple[Dict
     Raises:
         ValueError: If profile not found
     """
-    if profile_name not in PROFILES:
-        available = ", ".join(PROFILES.keys())
+    profile = _get_profile(profile_name)
+    if profile is None:
+        available = ", ".join(_PROFILE_DEFINITIONS.keys())
         raise ValueError(f"Unknown profile '{profile_name}'. Available: {available}")
     
-    profile = PROFILES[profile_name]
-    return profile["portfolio_state"], profile["positions"]
+    return profile["portfolio_state"], [p.as_dict() for p in profile["positions"]]
 
 
 def get_demo_candidates(profile_name: str = "OVERCONCENTRATED_TECH") -> List[Dict[str, Any]]:
     """Get trade candidates for a demo profile."""
-    if profile_name not in PROFILES:
+    profile = _get_profile(profile_name)
+    if profile is None:
         return []
-    return PROFILES[profile_name].get("candidates", [])
+    return profile.get("candidates", [])
 
 
 def get_demo_heatmap(profile_name: str = "OVERCONCENTRATED_TECH") -> Dict[str, int]:
     """Get sector heatmap for a demo profile."""
-    if profile_name not in PROFILES:
+    profile = _get_profile(profile_name)
+    if profile is None:
         return {"TECH": 70, "FINANCE": 60}
-    return PROFILES[profile_name].get("sector_heatmap", {})
+    return profile.get("sector_heatmap", {})
+
+
+def get_sector_breakdown(profile_name: str) -> Dict[str, float]:
+    """Get precomputed sector exposure (% of total capital), largest first."""
+    profile = _get_profile(profile_name)
+    if profile is None:
+        return {}
+    # Copy: the cached breakdown is shared by every later call
+    return dict(profile["_sector_pct"])
 
 
 def get_profile_description(profile_name: str) -> str:
     """Get human-readable description of a profile."""
-    if profile_name not in PROFILES:
+    profile = _get_profile(profile_name)
+    if profile is None:
         return "Unknown profile"
-    return PROFILES[profile_name].get("description", "No description")
+    return profile.get("description", "No description")
 
 
 # =============================================================================
@@ -433,29 +509,22 @@ if __name__ == "__main__":
     print("DEMO PORTFOLIO PROFILES - Validation")
     print("=" * 70)
     
-    for name in get_available_profiles():
-        print(f"\n[Profile: {name}]")
-        print(f"  Description: {get_profile_description(name)}")
+    for name in _PROFILE_DEFINITIONS:
+        profile = _get_profile(name)
+        portfolio = profile["portfolio_state"]
         
-        portfolio, positions = load_demo_profile(name)
+        print(f"\n[Profile: {name}]")
+        print(f"  Description: {profile.get('description', 'No description')}")
         print(f"  Capital: ${portfolio['total_capital']:,.0f}")
         print(f"  Cash: ${portfolio['cash']:,.0f}")
-        print(f"  Positions: {len(positions)}")
-        
-        # Calculate sector concentration
-        sectors = {}
-        for p in positions:
-            sector = p["sector"]
-            sectors[sector] = sectors.get(sector, 0) + p["capital_allocated"]
+        print(f"  Positions: {len(profile['positions'])}")
         
-        total = portfolio["total_capital"]
+        # Sector concentration (precomputed when the profile is first loaded)
         print(f"  Sector Breakdown:")
-        for sector, alloc in sorted(sectors.items(), key=lambda x: -x[1]):
-            pct = (alloc / total) * 100
+        for sector, pct in get_sector_breakdown(name).items():
             print(f"    - {sector}: {pct:.1f}%")
         
-        candidates = get_demo_candidates(name)
-        print(f"  Candidates: {len(candidates)}")
+        print(f"  Candidates: {len(profile.get('candidates', ()))}")
     
     print("\n" + "=" * 70)
     print("✅ All profiles valid")
@@ -16,7 +16,8 @@ Usage:
 Author: Quantitative Portfolio Engineering Team
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Optional, Tuple
 
 
 # =============================================================================
@@ -72,6 +73,38 @@ TREND_OVERLAYS = {
 }
 
 
+# Flat per-overlay record so the apply_* hot paths read fixed tuple fields
+# instead of chaining .get() calls on nested dicts.
+class _OverlayRecord(NamedTuple):
+    confidence_modifier: int
+    news_bias: int
+    volatility_state: Optional[str]
+    sector_adjustments: Tuple[Tuple[str, int], ...]
+
+
+_OVERLAY_TABLE = {
+    name: _OverlayRecord(
+        overlay.get("confidence_modifier", 0),
+        overlay.get("news_bias", 0),
+        overlay.get("volatility_state"),
+        tuple(overlay.get("sector_adjustments", {}).items())
+    )
+    for name, overlay in TREND_OVERLAYS.items()
+}
+
+# Precomputed 0-100 clamp covering every reachable score + modifier sum.
+# Indexing the table replaces the nested max()/min() builtin calls.
+_CLAMP_OFFSET = 200
+_CLAMP = bytes(max(0, min(100, v)) for v in range(-_CLAMP_OFFSET, 301))
+
+
+def _clamp_score(value: int) -> int:
+    """Clamp an integer score to 0-100 (table lookup, builtin fallback)."""
+    if type(value) is int and -_CLAMP_OFFSET <= value <= 300:
+        return _CLAMP[value + _CLAMP_OFFSET]
+    return max(0, min(100, value))
+
+
 # =============================================================================
 # PUBLIC API
 # =============================================================================
@@ -81,6 +114,7 @@ def get_available_overlays() -> list:
     return list(TREND_OVERLAYS.keys())
 
 
+@lru_cache(maxsize=32)
 def get_overlay(name: str) -> Optional[Dict[str, Any]]:
     """
     Get a trend overlay by name.
@@ -94,6 +128,12 @@ def get_overlay(name: str) -> Optional[Dict[str, Any]]:
     return TREND_OVERLAYS.get(name.upper())
 
 
+@lru_cache(maxsize=32)
+def _get_record(name: str) -> Optional[_OverlayRecord]:
+    """Flat overlay record for an overlay name (case-insensitive)."""
+    return _OVERLAY_TABLE.get(name.upper())
+
+
 def get_overlay_description(name: str) -> str:
     """Get human-readable description of an overlay."""
     overlay = get_overlay(name)
@@ -113,10 +153,10 @@ def apply_overlay_to_volatility(base_state: str, overlay_name: str) -> str:
     Returns:
         Modified volatility state
     """
-    overlay = get_overlay(overlay_name)
-    if not overlay or not overlay.get("volatility_state"):
+    record = _get_record(overlay_name)
+    if not record or not record.volatility_state:
         return base_state
-    return overlay["volatility_state"]
+    return record.volatility_state
 
 
 def apply_overlay_to_confidence(base_confidence: int, overlay_name: str) -> int:
@@ -130,12 +170,11 @@ def apply_overlay_to_confidence(base_confidence: int, overlay_name: str) -> int:
     Returns:
         Modified confidence (clamped 0-100)
     """
-    overlay = get_overlay(overlay_name)
-    if not overlay:
+    record = _get_record(overlay_name)
+    if not record:
         return base_confidence
     
-    modifier = overlay.get("confidence_modifier", 0)
-    return max(0, min(100, base_confidence + modifier))
+    return _clamp_score(base_confidence + record.confidence_modifier)
 
 
 def apply_overlay_to_news(base_score: int, overlay_name: str) -> int:
@@ -149,12 +188,11 @@ def apply_overlay_to_news(base_score: int, overlay_name: str) -> int:
     Returns:
         Modified score (clamped 0-100)
     """
-    overlay = get_overlay(overlay_name)
-    if not overlay:
+    record = _get_record(overlay_name)
+    if not record:
         return base_score
     
-    bias = overlay.get("news_bias", 0)
-    return max(0, min(100, base_score + bias))
+    return _clamp_score(base_score + record.news_bias)
 
 
 def apply_overlay_to_heatmap(base_heatmap: Dict[str, int], overlay_name: str) -> Dict[str, int]:
@@ -168,20 +206,16 @@ def apply_overlay_to_heatmap(base_heatmap: Dict[str, int], overlay_name: str) ->
     Returns:
         Modified heatmap (values clamped 0-100)
     """
-    overlay = get_overlay(overlay_name)
-    if not overlay:
+    record = _get_record(overlay_name)
+    if not record:
         return base_heatmap
     
-    adjustments = overlay.get("sector_adjustments", {})
-    result = base_heatmap.copy()
-    
-    for sector, adjustment in adjustments.items():
-        if sector in result:
-            result[sector] = max(0, min(100, result[sector] + adjustment))
-        else:
-            result[sector] = max(0, min(100, 50 + adjustment))  # Default 50 if new
-    
-    return result
+    # Sectors missing from the base heatmap start from a neutral 50
+    delta = {
+        sector: _clamp_score(base_heatmap.get(sector, 50) + adjustment)
+        for sector, adjustment in record.sector_adjustments
+    }
+    return {**base_heatmap, **delta}
 
 
 # =============================================================================
@@ -8,16 +8,96 @@ Strictly follows the rule: Weakest positions are addressed first.
 Output Contract:
 {
     "proposed_actions": [
-        {
-            "symbol": "ABC",
-            "action": "REDUCE | HOLD | MONITOR",
-            "reason": "Text explanation"
-        }
+        ProposedAction(
+            symbol="ABC",
+            action="REDUCE | HOLD | MONITOR",
+            reason="Text explanation"
+        )
     ]
 }
+Use ProposedAction.as_dict() (or plan_to_dict) at JSON boundaries.
 """
 
 import json
+from dataclasses import dataclass, asdict
+
+
+@dataclass(slots=True, frozen=True)
+class ProposedAction:
+    """A single planned (never executed) action for one position."""
+    symbol: str
+    action: str
+    reason: str
+
+    def as_dict(self) -> dict:
+        """Returns the action as a plain (JSON-safe) dict."""
+        return asdict(self)
+
+
+def plan_to_dict(plan: dict) -> dict:
+    """Converts a generate_execution_plan() result into plain dicts."""
+    return {
+        "proposed_actions": [a.as_dict() for a in plan.get("proposed_actions", [])]
+    }
+
+
+# ---------------------------------------------------------
+# Mode Handlers (vitals -> (action, reason))
+# ---------------------------------------------------------
+
+# Reason templates; integer vitals 0-100 (the vitals score range) are
+# pre-rendered at import, anything else is formatted on demand.
+_EXIT_TMPL = "RISK_OFF trigger. Exiting all positions (Vitals: %s)."
+_REDUCE_TMPL = "Defensive mode + Weak vitals (%s). reducing exposure."
+_HOLD_TMPL = "Defensive mode. Holding strong position (%s)."
+
+_EXIT_REASONS = tuple(_EXIT_TMPL % v for v in range(101))
+_REDUCE_REASONS = tuple(_REDUCE_TMPL % v for v in range(101))
+_HOLD_REASONS = tuple(_HOLD_TMPL % v for v in range(101))
+
+
+def _render(table, template, vitals):
+    if type(vitals) is int and 0 <= vitals <= 100:
+        return table[vitals]
+    return template % (vitals,)
+
+
+def _risk_off_action(vitals):
+    return "EXIT", _render(_EXIT_REASONS, _EXIT_TMPL, vitals)
+
+
+DEFENSIVE_REDUCE_BELOW = 50
+
+
+def _defensive_action(vitals):
+    # Compared per position (not split by position in the sorted order):
+    # non-comparable scores such as NaN must fall through to HOLD.
+    if vitals < DEFENSIVE_REDUCE_BELOW:
+        return "REDUCE", _render(_REDUCE_REASONS, _REDUCE_TMPL, vitals)
+    return "HOLD", _render(_HOLD_REASONS, _HOLD_TMPL, vitals)
+
+
+def _opportunity_action(vitals):
+    return "MONITOR", "Opportunity mode. No forced exits."
+
+
+def _default_action(vitals):
+    return "MONITOR", "Standard monitoring."
+
+
+_MODE_HANDLERS = {
+    "RISK_OFF": _risk_off_action,
+    "DEFENSIVE": _defensive_action,
+    "OPPORTUNITY": _opportunity_action,
+}
+
+
+def _to_columns(positions):
+    """Splits position dicts into parallel (symbols, vitals_scores) lists."""
+    symbols = [p.get("symbol", "UNKNOWN") for p in positions]
+    scores = [p.get("vitals_score", 0) for p in positions]
+    return symbols, scores
+
 
 def generate_execution_plan(decision_output: dict, positions: list[dict]) -> dict:
     """
@@ -31,43 +111,27 @@ def generate_execution_plan(decision_output: dict, positions: list[dict]) -> dic
         dict: conformant to output contract.
     """
     mode = decision_output.get("decision", "NEUTRAL")
+
+    if not positions:
+        return {"proposed_actions": []}
     
     # 1. Sort positions by vitals (Weakest First)
     # Default to 100 if score missing to push reliable data to front if needed, 
     # but here we want weak ones first, so 0 is worst.
-    sorted_positions = sorted(positions, key=lambda p: p.get("vitals_score", 0))
+    # Positions are read once into columns (struct-of-arrays); the rest of the
+    # planner indexes these lists instead of doing per-row dict lookups.
+    # Scores are argsorted with a C-level key (stable).
+    symbols, scores = _to_columns(positions)
+    order = sorted(range(len(positions)), key=scores.__getitem__)
+
+    # 2. Apply Mode Logic (handler selected once; mode is constant per call)
+    handler = _MODE_HANDLERS.get(mode, _default_action)
 
     proposed_actions = []
 
-    for pos in sorted_positions:
-        symbol = pos.get("symbol", "UNKNOWN")
-        vitals = pos.get("vitals_score", 0)
-        
-        action = "MONITOR"
-        reason = "Standard monitoring."
-
-        # 2. Apply Mode Logic
-        if mode == "RISK_OFF":
-            action = "EXIT"
-            reason = f"RISK_OFF trigger. Exiting all positions (Vitals: {vitals})."
-            
-        elif mode == "DEFENSIVE":
-            if vitals < 50:
-                action = "REDUCE"
-                reason = f"Defensive mode + Weak vitals ({vitals}). reducing exposure."
-            else:
-                action = "HOLD"
-                reason = f"Defensive mode. Holding strong position ({vitals})."
-                
-        elif mode == "OPPORTUNITY":
-            action = "MONITOR"
-            reason = "Opportunity mode. No forced exits."
-
-        proposed_actions.append({
-            "symbol": symbol,
-            "action": action,
-            "reason": reason
-        })
+    for i in order:
+        action, reason = handler(scores[i])
+        proposed_actions.append(ProposedAction(symbols[i], action, reason))
 
     return {
         "proposed_actions": proposed_actions
@@ -96,5 +160,5 @@ if __name__ == "__main__":
     for scenario in scenarios:
         print(f"Scenario: {scenario['decision']}")
         plan = generate_execution_plan(scenario, mock_positions)
-        print(json.dumps(plan, indent=2))
+        print(json.dumps(plan_to_dict(plan), indent=2))
         print("-" * 40)
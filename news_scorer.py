@@ -11,10 +11,40 @@ Rules:
 - Output normalized to 0-100.
 """
 
+# Configuration (Refinable)
+STARTING_SCORE = 50
+POINT_WEIGHT = 5
+MAX_SCORE = 100
+MIN_SCORE = 0
+
+# Keyword Definitions (Tech Focused)
+POSITIVE_KEYWORDS = {
+    "growth", "demand", "beats", "rally", "soar", "surge", 
+    "upgrade", "strong", "record", "bullish", "profit", 
+    "innovation", "breakthrough", "high", "jump"
+}
+
+NEGATIVE_KEYWORDS = {
+    "slowdown", "risk", "regulation", "crash", "slump", 
+    "downgrade", "weak", "miss", "volatility", "concern",
+    "inflation", "drop", "bearish", "loss", "decline", "warns"
+}
+
+# Flat (keyword, signed weight) table built once at import
+_WEIGHTED_KEYWORDS = tuple(
+    [(word, POINT_WEIGHT) for word in sorted(POSITIVE_KEYWORDS)] +
+    [(word, -POINT_WEIGHT) for word in sorted(NEGATIVE_KEYWORDS)]
+)
+
+
 def score_tech_news(headlines: list[str]) -> dict:
     """
     Scores a list of Technology sector headlines based on fixed keywords.
 
+    Each keyword counts at most once per headline (substring match on the
+    lowercased text). The batch is scanned once as a joined corpus so that
+    keywords absent from every headline are never tested per headline.
+
     Args:
         headlines (list[str]): List of news headline strings.
 
@@ -30,39 +60,20 @@ def score_tech_news(headlines: list[str]) -> dict:
             "headline_count": 0
         }
 
-    # Configuration (Refinable)
-    STARTING_SCORE = 50
-    POINT_WEIGHT = 5
-    MAX_SCORE = 100
-    MIN_SCORE = 0
-
-    # Keyword Definitions (Tech Focused)
-    POSITIVE_KEYWORDS = {
-        "growth", "demand", "beats", "rally", "soar", "surge", 
-        "upgrade", "strong", "record", "bullish", "profit", 
-        "innovation", "breakthrough", "high", "jump"
-    }
+    # Normalize text for matching
+    texts = [headline.lower() for headline in headlines]
 
-    NEGATIVE_KEYWORDS = {
-        "slowdown", "risk", "regulation", "crash", "slump", 
-        "downgrade", "weak", "miss", "volatility", "concern",
-        "inflation", "drop", "bearish", "loss", "decline", "warns"
-    }
+    # Batch prefilter: keywords cannot span the newline separator
+    corpus = "\n".join(texts)
+    present = [(word, weight) for word, weight in _WEIGHTED_KEYWORDS if word in corpus]
 
     current_score = STARTING_SCORE
 
-    for headline in headlines:
-        # Normalize text for matching
-        text = headline.lower()
-        
-        # Scoring Logic
-        for word in POSITIVE_KEYWORDS:
-            if word in text:
-                current_score += POINT_WEIGHT
-        
-        for word in NEGATIVE_KEYWORDS:
+    # Scoring Logic
+    for text in texts:
+        for word, weight in present:
             if word in text:
-                current_score -= POINT_WEIGHT
+                current_score += weight
 
     # Clamping
     final_score = max(MIN_SCORE, min(MAX_SCORE, current_score))
@@ -24,6 +24,7 @@ import os
 import requests
 import logging
 import datetime
+from operator import itemgetter
 from typing import List, Dict, Any
 
 # Configure logging
@@ -130,7 +131,7 @@ def fetch_tech_sector_candles(limit: int = 50) -> List[Dict[str, Any]]:
                 continue
         
         # Ensure sorting: Oldest -> Newest
-        parsed_candles.sort(key=lambda x: x["timestamp"])
+        parsed_candles.sort(key=itemgetter("timestamp"))
 
         # Return the most recent 'limit' candles
         # If we have fewer than limit, return all we have
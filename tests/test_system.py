@@ -226,6 +226,8 @@ def test_decision_engine():
     """Test decision engine produces valid output for each profile."""
     print_header("DECISION ENGINE INTEGRATION")
     
+    import json
+    import math
     import decision_engine
     from demo.demo_profiles import (
         get_available_profiles, 
@@ -258,11 +260,22 @@ def test_decision_engine():
             )
             
             # Validate output
-            assert "decisions" in result, "Missing decisions"
-            assert "market_posture" in result, "Missing market_posture"
+            report = result.as_dict()
+            assert "decisions" in report, "Missing decisions"
+            assert "market_posture" in report, "Missing market_posture"
             
-            decisions = result.get("decisions", [])
-            blocked = result.get("blocked_by_safety", [])
+            # Report content: decision records, posture and pressure score
+            for d in result.decisions:
+                missing = {"type", "target", "action", "score"} - set(d)
+                assert not missing, f"Decision missing {sorted(missing)}"
+            assert {"market_posture", "risk_level"} <= set(result.market_posture), "Incomplete market_posture"
+            assert isinstance(result.pressure_score, (int, float)) and not isinstance(result.pressure_score, bool), \
+                "pressure_score is not numeric"
+            assert math.isfinite(result.pressure_score), "pressure_score is not finite"
+            json.dumps(report)
+            
+            decisions = result.decisions
+            blocked = result.blocked_by_safety
             
             print_result(f"Engine: {profile_name}", True)
             print(f"           Decisions: {len(decisions)}, Blocked: {len(blocked)}")
@@ -274,6 +287,114 @@ def test_decision_engine():
     return all_passed
 
 
+# =============================================================================
+# 6. API OUTPUT CONTRACT
+# =============================================================================
+
+def test_api_output_contract():
+    """Test run_demo_scenario's execution plan stays plain JSON-safe dicts."""
+    print_header("API OUTPUT CONTRACT")
+    
+    import json
+    from unittest import mock
+    import full_system_demo
+    from backend.scenarios import SCENARIOS
+    
+    closed = {"is_open": False, "next_open": None, "next_close": None,
+              "label": "CLOSED", "timestamp": "2026-01-31T10:00:00"}
+    all_passed = True
+    planned = 0
+    
+    for scenario_id in [None, *SCENARIOS]:
+        desc = f"Execution plan: {scenario_id or 'default'}"
+        try:
+            with mock.patch.object(full_system_demo, "get_market_status_cached", return_value=closed):
+                result = full_system_demo.run_demo_scenario(scenario_id)
+            
+            plan = result["analysis"]["execution_plan"]
+            assert type(plan) is list, f"execution_plan is {type(plan).__name__}"
+            for step in plan:
+                assert type(step) is dict, f"Plan step is {type(step).__name__}"
+                assert set(step) == {"symbol", "action", "reason"}, f"Plan step keys: {sorted(step)}"
+                assert all(type(v) is str for v in step.values()), "Non-string plan value"
+            assert json.loads(json.dumps(plan)) == plan, "Plan does not survive JSON"
+            planned += bool(plan)
+            
+            print_result(desc, True)
+        except Exception as e:
+            print_result(desc, False, str(e))
+            all_passed = False
+    
+    if not planned:
+        print_result("At least one scenario produces a plan", False)
+        all_passed = False
+    
+    return all_passed
+
+
+# =============================================================================
+# 7. MARKET STATUS CACHE
+# =============================================================================
+
+def test_market_status_cache():
+    """Test the clock cache skips failed lookups, bounds staleness and expires per bucket."""
+    print_header("MARKET STATUS CACHE")
+    
+    from unittest import mock
+    import full_system_demo
+    from backend import market_status
+    
+    def status(label, is_open):
+        return {"is_open": is_open, "next_open": None, "next_close": None,
+                "label": label, "timestamp": "2026-01-31T10:00:00"}
+    
+    responses = [
+        status(market_status.ERROR_LABEL, False),  # transient failure
+        status("OPEN", True),                      # clock recovered
+        status(market_status.ERROR_LABEL, False),  # fails again, next bucket
+        status("CLOSED", False),                   # recovered, next bucket
+        status(market_status.ERROR_LABEL, False),  # outage outlasting the stale window
+    ]
+    now = [0.0]
+    ttl = full_system_demo.MARKET_STATUS_TTL_SECONDS
+    all_passed = True
+    
+    try:
+        with mock.patch.object(market_status, "get_market_status", side_effect=responses) as clock, \
+             mock.patch.object(full_system_demo.time, "time", lambda: now[0]), \
+             mock.patch.dict(full_system_demo._market_status_cache, {"bucket": None, "good": None}):
+            get = full_system_demo.get_market_status_cached
+            
+            first = get()
+            assert first["label"] == market_status.ERROR_LABEL, "Failure not reported with no prior status"
+            
+            second = get()
+            assert second["label"] == "OPEN", "Error status was cached"
+            
+            second["label"] = "MUTATED"
+            third = get()
+            assert third["label"] == "OPEN", "Cached status shared with caller"
+            assert clock.call_count == 2, "Good status not reused within the bucket"
+            
+            now[0] += ttl
+            stale = get()
+            assert stale["label"] == "OPEN", "Last good status not served on failure"
+            
+            fresh = get()
+            assert fresh["label"] == "CLOSED", "Bucket rollover did not refresh the status"
+            
+            now[0] += ttl + full_system_demo.MARKET_STATUS_STALE_SECONDS
+            expired = get()
+            assert expired["label"] == market_status.ERROR_LABEL, "Stale status served past its window"
+            assert clock.call_count == 5, "Unexpected clock calls"
+        print_result("Clock failure, recovery, stale window and rollover", True)
+    except Exception as e:
+        print_result("Clock failure, recovery, stale window and rollover", False, str(e))
+        all_passed = False
+    
+    return all_passed
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -290,6 +411,8 @@ def run_all_tests():
         "Demo Profiles": test_demo_profiles(),
         "Signal Integrity": test_signal_integrity(),
         "Decision Engine": test_decision_engine(),
+        "API Output Contract": test_api_output_contract(),
+        "Market Status Cache": test_market_status_cache(),
     }
     
     # Summary
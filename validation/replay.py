@@ -7,6 +7,7 @@ as it would have appeared at that moment, and feeding it to the Decision Engine.
 """
 
 from datetime import datetime, timedelta
+from operator import itemgetter
 import pandas as pd
 import decision_engine
 from validation.data_manager import HistoricalDataManager
@@ -39,7 +40,7 @@ class HistoricalReplayEngine:
             
             # Index by date string for O(1) lookup
             # But simpler: just keep list and slice
-            self.market_data[sym] = sorted(data, key=lambda x: x['timestamp'])
+            self.market_data[sym] = sorted(data, key=itemgetter('timestamp'))
             
     def run(self):
         """Executes the replay loop."""
@@ -82,11 +83,11 @@ class HistoricalReplayEngine:
                 )
                 
                 # 3. Track Metrics
-                self.metrics.record_cycle(report["decisions"], self.portfolio)
+                self.metrics.record_cycle(report.decisions, self.portfolio)
                 
                 # Optional: Visualization / Progress
                 if self.metrics.total_cycles % 10 == 0:
-                    print(f"   Now: {date_str} | Decisions: {len(report['decisions'])} | Posture: {report['market_posture']['market_posture']}")
+                    print(f"   Now: {date_str} | Decisions: {len(report.decisions)} | Posture: {report.market_posture['market_posture']}")
                     
             except Exception as e:
                 print(f"❌ Error on {date_str}: {e}")
@@ -33,8 +33,12 @@ def compute_atr(candles: List[Dict], period: int = 14) -> Dict[str, Optional[flo
         return {"atr": None}
 
     # 3. Compute True Range (TR) Series
+    # Only the newest `period` valid TRs feed the SMA, so walk backwards from
+    # the latest candle and stop once the window is full.
     tr_values = []
-    for i in range(1, len(sorted_candles)):
+    for i in range(len(sorted_candles) - 1, 0, -1):
+        if len(tr_values) == period:
+            break
         current = sorted_candles[i]
         prev = sorted_candles[i-1]
         try:
@@ -55,9 +59,9 @@ def compute_atr(candles: List[Dict], period: int = 14) -> Dict[str, Optional[flo
     # 4. Compute ATR (SMA)
     if len(tr_values) < period:
         return {"atr": None}
-        
-    recent_tr = tr_values[-period:]
-    atr_value = sum(recent_tr) / period
+    
+    tr_values.reverse()  # Oldest -> Newest, same summation order as before
+    atr_value = sum(tr_values) / period
     
     return {"atr": round(atr_value, 4)}
 